@@ -1,22 +1,82 @@
 import os
 import re
+import copy
+import struct
 import json
 import argparse
-import tempfile
-import requests
-from urllib.parse import urlparse
+import threading
+from collections import deque
+from itertools import takewhile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from docx import Document
 from docx.shared import Pt, RGBColor, Inches, Cm
 from docx.enum.section import WD_HEADER_FOOTER
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK, WD_LINE_SPACING
 from docx.enum.section import WD_ORIENT, WD_SECTION
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
-import markdown
-from bs4 import BeautifulSoup
-from PIL import Image
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.table import CT_Tbl
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+from lxml import etree
 import io
 
+# Expressions régulières précompilées
+_HEADER_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_CHAPTER_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_IMG_RE = re.compile(r'!\[(.*?)\]\((.*?)\)')
+_LIST_RE = re.compile(r'^(\s*)([\*\-\+]|\d+\.)\s+(.+)$')
+_RUN_BREAK_RE = re.compile(r'([\t\n\r])')
+
+# Caractères pouvant ouvrir un formatage inline (gras/italique, code, lien)
+_INLINE_OPENERS = ('*', '_', '`', '[')
+
+# Alignements de paragraphe acceptés dans la configuration
+_ALIGN_MAP = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY
+}
+
+# Marqueurs de liste non ordonnée en Markdown
+_BULLET_MARKERS = frozenset(('*', '-', '+'))
+
+# Nombre de niveaux d'indentation de liste dont le retrait est précalculé
+_LIST_LEVELS = 16
+
+# Styles Word des paragraphes de liste, par type de liste
+_LIST_STYLE_NAMES = {'ul': 'List Bullet', 'ol': 'List Number'}
+
+# Types de formatage inline produits par _parse_inline
+_INLINE_FORMATS = ('normal', 'bold', 'italic', 'code', 'link')
+
+# Balises HTML de listes
+_LIST_TAGS = frozenset(('ol', 'ul'))
+
+# Noms qualifiés des attributs OOXML (qn() analyse le préfixe à chaque appel)
+_QN_FILL = qn('w:fill')
+_QN_FLDCHARTYPE = qn('w:fldCharType')
+_QN_XMLSPACE = qn('xml:space')
+
+# Déclaration d'espace de noms pour les fragments XML construits en texte
+_W_NSDECL = nsdecls('w')
+
+# Échappement des caractères spéciaux XML (texte et valeurs d'attributs)
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+def _esc(text):
+    """Échappe un texte pour l'insérer dans un fragment XML"""
+    return text.translate(_XML_ESCAPE)
+
+# Session HTTP partagée : les connexions sont réutilisées entre les téléchargements
+# d'images. Elle est créée au premier téléchargement (voir _get_session), ce qui
+# évite d'importer requests quand le document n'a pas d'image distante
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
 # Configuration par défaut
 DEFAULT_CONFIG = {
     "styles": {
@@ -156,7 +216,8 @@ def load_config(config_file=None):
     Returns:
         dict: Configuration chargée ou configuration par défaut
     """
-    config = DEFAULT_CONFIG.copy()
+    # Copie profonde : la fusion ne doit jamais modifier DEFAULT_CONFIG
+    config = copy.deepcopy(DEFAULT_CONFIG)
     
     if config_file and os.path.exists(config_file):
         try:
@@ -180,11 +241,121 @@ def merge_configs(default_config, user_config):
         default_config (dict): Configuration par défaut
         user_config (dict): Configuration utilisateur
     """
-    for key, value in user_config.items():
-        if key in default_config and isinstance(default_config[key], dict) and isinstance(value, dict):
-            merge_configs(default_config[key], value)
+    # Parcours itératif des dictionnaires imbriqués
+    pending = [(default_config, user_config)]
+    
+    while pending:
+        target, source = pending.pop()
+        
+        for key, value in source.items():
+            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                pending.append((target[key], value))
+            else:
+                target[key] = value
+
+def compile_style(style):
+    """
+    Convertit les valeurs d'un style en objets python-docx (Pt, RGBColor, alignement)
+    
+    Args:
+        style (dict): Dictionnaire contenant les propriétés de style
+        
+    Returns:
+        dict: Style dont les tailles, la couleur et l'alignement sont déjà convertis
+    """
+    compiled = dict(style)
+    
+    for key in ("font_size", "space_before", "space_after"):
+        if key in style:
+            compiled[key] = Pt(style[key])
+    
+    if "color" in style:
+        r = style["color"].get("r", 0)
+        g = style["color"].get("g", 0)
+        b = style["color"].get("b", 0)
+        compiled["color"] = RGBColor(r, g, b)
+    
+    # Un alignement inconnu est ignoré
+    if "alignment" in style:
+        alignment = _ALIGN_MAP.get(style["alignment"])
+        if alignment is None:
+            del compiled["alignment"]
         else:
-            default_config[key] = value
+            compiled["alignment"] = alignment
+    
+    return compiled
+
+class CompiledStyles:
+    """
+    Styles de la configuration convertis à la demande (voir compile_style) :
+    chaque style n'est compilé qu'une fois, et seulement s'il est utilisé
+    """
+    
+    def __init__(self, styles):
+        self._styles = styles
+        self._compiled = {}
+    
+    def __getitem__(self, name):
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            compiled = self._compiled[name] = compile_style(self._styles[name])
+        return compiled
+    
+    def get(self, name, default=None):
+        """Retourne le style compilé, ou default s'il n'est pas configuré"""
+        if name not in self._styles:
+            return default
+        return self[name]
+
+class _LazyDict(dict):
+    """
+    Dictionnaire dont chaque valeur est calculée par factory(clé) au premier
+    accès, puis conservée pour les accès suivants
+    """
+    
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory
+    
+    def __missing__(self, key):
+        value = self[key] = self._factory(key)
+        return value
+
+def get_page_setup(config):
+    """
+    Retourne les dimensions de page et les marges converties en Cm
+    
+    Args:
+        config (dict): Configuration
+        
+    Returns:
+        dict: Dimensions de page et marges
+    """
+    page_size = config["document"]["page_size"]
+    margins = config["document"]["margins"]
+    return {
+        "page_width": Cm(page_size["width"]),
+        "page_height": Cm(page_size["height"]),
+        "top_margin": Cm(margins["top"]),
+        "bottom_margin": Cm(margins["bottom"]),
+        "left_margin": Cm(margins["left"]),
+        "right_margin": Cm(margins["right"])
+    }
+
+def apply_page_setup(section, page_setup):
+    """
+    Applique les dimensions de page et les marges à une section
+    
+    Args:
+        section: Section Word
+        page_setup (dict): Dimensions de page et marges (voir get_page_setup)
+    """
+    section.page_width = page_setup["page_width"]
+    section.page_height = page_setup["page_height"]
+    section.top_margin = page_setup["top_margin"]
+    section.bottom_margin = page_setup["bottom_margin"]
+    section.left_margin = page_setup["left_margin"]
+    section.right_margin = page_setup["right_margin"]
 
 def extract_image_caption(element):
     """
@@ -199,48 +370,153 @@ def extract_image_caption(element):
     caption = element.get('alt') or element.get('title')
     return caption
 
-def download_image(url, temp_dir=None):
+def _get_session():
+    """
+    Retourne la session HTTP partagée, créée au premier appel
+    
+    Returns:
+        requests.Session: Session utilisée pour télécharger les images
+    """
+    global _SESSION
+    
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=1))
+            session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=1))
+            _SESSION = session
+    
+    return _SESSION
+
+def download_image(url):
     """
-    Télécharge une image depuis une URL et la sauvegarde dans un dossier temporaire
+    Télécharge une image depuis une URL
     
     Args:
         url (str): URL de l'image à télécharger
-        temp_dir (str): Dossier temporaire (si None, utilise le dossier temp du système)
         
     Returns:
-        str: Chemin vers l'image téléchargée, None en cas d'erreur
+        bytes: Contenu de l'image téléchargée, None en cas d'erreur
     """
-    if temp_dir is None:
-        temp_dir = tempfile.gettempdir()
-    
     try:
-        # Créer un nom de fichier à partir de l'URL
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
-        
-        # S'assurer que le nom de fichier est valide
-        if not filename or '.' not in filename:
-            filename = f"image_{hash(url)}.jpg"
-        
-        # Chemin complet du fichier
-        filepath = os.path.join(temp_dir, filename)
-        
         # Télécharger l'image
-        response = requests.get(url, stream=True, timeout=10)
-        response.raise_for_status()  # Vérifier si la requête a réussi
-        
-        # Sauvegarder l'image
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        return filepath
+        with _get_session().get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()  # Vérifier si la requête a réussi
+            
+            # Lire le corps en une fois plutôt que par blocs de 10 Ko (response.content),
+            # en décompressant un éventuel encodage gzip/deflate
+            response.raw.decode_content = True
+            return response.raw.read()
     
     except Exception as e:
         print(f"Erreur lors du téléchargement de l'image {url}: {e}")
         return None
 
-def add_image_to_doc(doc, img_path, base_path, config, caption=None):
+def prefetch_remote_images(image_paths, image_cache, max_workers=8):
+    """
+    Télécharge en parallèle les images distantes parmi les images d'un fichier Markdown
+    
+    Args:
+        image_paths (list): Chemins ou URL des images référencées
+        image_cache (dict): Images déjà téléchargées (URL -> contenu), complété sur place
+        max_workers (int): Nombre maximal de téléchargements simultanés
+    """
+    urls = [path for path in image_paths if path.startswith(('http://', 'https://'))]
+    
+    # Chaque URL n'est téléchargée qu'une seule fois par conversion
+    urls = [url for url in dict.fromkeys(urls) if url not in image_cache]
+    if not urls:
+        return
+    
+    for url in urls:
+        print(f"Téléchargement de l'image distante: {url}")
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        image_cache.update(zip(urls, executor.map(download_image, urls)))
+
+def get_image_size(source):
+    """
+    Lit les dimensions d'une image PNG, JPEG ou GIF dans son en-tête, sans Pillow
+    
+    Args:
+        source: Chemin de l'image ou flux binaire (la position du flux est conservée)
+        
+    Returns:
+        tuple: (largeur, hauteur) en pixels, None si le format n'est pas reconnu
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as stream:
+            return read_image_size(stream)
+    
+    position = source.tell()
+    try:
+        return read_image_size(source)
+    finally:
+        source.seek(position)
+
+def read_image_size(stream):
+    """
+    Lit les dimensions d'une image PNG, JPEG ou GIF depuis le début d'un flux binaire
+    
+    Args:
+        stream: Flux binaire positionné au début de l'image
+        
+    Returns:
+        tuple: (largeur, hauteur) en pixels, None si le format n'est pas reconnu
+    """
+    start = stream.tell()
+    header = stream.read(24)
+    
+    # PNG : signature puis chunk IHDR (largeur et hauteur sur 4 octets big-endian)
+    if header.startswith(b'\x89PNG\r\n\x1a\n') and header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    
+    # GIF : descripteur d'écran logique (little-endian)
+    if header[:6] in (b'GIF87a', b'GIF89a') and len(header) >= 10:
+        return struct.unpack('<HH', header[6:10])
+    
+    # JPEG : parcourir les segments jusqu'au marqueur SOFn
+    if header.startswith(b'\xff\xd8'):
+        stream.seek(start + 2)
+        while True:
+            # Chaque marqueur est précédé d'un ou plusieurs octets 0xFF
+            byte = stream.read(1)
+            if byte != b'\xff':
+                return None
+            while byte == b'\xff':
+                byte = stream.read(1)
+            if not byte:
+                return None
+            
+            marker = byte[0]
+            # Marqueurs sans segment (TEM, RSTn)
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                continue
+            # Fin d'image ou début des données avant tout SOFn
+            if marker in (0xD9, 0xDA):
+                return None
+            
+            segment = stream.read(2)
+            if len(segment) < 2:
+                return None
+            length = struct.unpack('>H', segment)[0]
+            
+            # SOF0 à SOF15, sauf DHT (C4), JPG (C8) et DAC (CC)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                data = stream.read(5)
+                if len(data) < 5:
+                    return None
+                height, width = struct.unpack('>xHH', data)
+                return width, height
+            
+            stream.seek(length - 2, 1)
+    
+    return None
+
+def add_image_to_doc(doc, img_path, base_path, config, caption=None, image_cache=None, styles=None):
     """
     Ajoute une image au document Word
     
@@ -250,22 +526,33 @@ def add_image_to_doc(doc, img_path, base_path, config, caption=None):
         base_path (str): Chemin de base pour les chemins relatifs
         config (dict): Configuration
         caption (str): Légende de l'image
+        image_cache (dict): Images distantes déjà téléchargées (URL -> contenu)
+        styles (CompiledStyles): Styles compilés (créés depuis config si None)
     """
+    if styles is None:
+        styles = CompiledStyles(config["styles"])
+    
     # Vérifier si c'est une URL
     is_url = img_path.startswith(('http://', 'https://'))
     
     if is_url:
-        # Tenter de télécharger l'image
-        print(f"Téléchargement de l'image distante: {img_path}")
-        downloaded_img_path = download_image(img_path)
-        
-        if downloaded_img_path and os.path.exists(downloaded_img_path):
-            img_path = downloaded_img_path
+        if image_cache is not None and img_path in image_cache:
+            img_data = image_cache[img_path]
         else:
+            # Tenter de télécharger l'image
+            print(f"Téléchargement de l'image distante: {img_path}")
+            img_data = download_image(img_path)
+            if image_cache is not None:
+                image_cache[img_path] = img_data
+        
+        if not img_data:
             # Si le téléchargement a échoué
             p = doc.add_paragraph(f"[Image externe non téléchargée: {img_path}]")
-            apply_para_style(p, config["styles"]["normal"])
+            apply_para_style(p, styles["normal"])
             return
+        
+        # L'image reste en mémoire, sans passer par un fichier temporaire
+        img_source = io.BytesIO(img_data)
     else:
         # Gestion des chemins relatifs pour les fichiers locaux
         if not os.path.isabs(img_path):
@@ -274,16 +561,25 @@ def add_image_to_doc(doc, img_path, base_path, config, caption=None):
         if not os.path.exists(img_path):
             print(f"Avertissement: Impossible de trouver l'image {img_path}")
             p = doc.add_paragraph(f"[Image non trouvée: {os.path.basename(img_path)}]")
-            apply_para_style(p, config["styles"]["normal"])
+            apply_para_style(p, styles["normal"])
             return
+        
+        img_source = img_path
     
     try:
         # Ajout de l'image
         max_width = Cm(config["document"]["image_max_width"])
         
-        # Redimensionnement intelligent de l'image pour qu'elle s'adapte à la page
-        img = Image.open(img_path)
-        width, height = img.size
+        # Redimensionnement intelligent de l'image pour qu'elle s'adapte à la page :
+        # dimensions lues directement dans l'en-tête (PNG, JPEG, GIF), Pillow pour
+        # les autres formats (seul l'en-tête est lu, les pixels ne sont jamais décodés)
+        size = get_image_size(img_source)
+        if size is None:
+            from PIL import Image  # Importé seulement pour les formats non reconnus
+            
+            with Image.open(img_source) as img:
+                size = img.size
+        width, height = size
         
         # Convertir max_width de cm à pixels (approximation : 1 cm = 37.8 pixels)
         max_width_px = max_width.cm * 37.8
@@ -301,18 +597,18 @@ def add_image_to_doc(doc, img_path, base_path, config, caption=None):
         p = doc.add_paragraph()
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = p.add_run()
-        run.add_picture(img_path, width=Cm(new_width / 37.8))
+        run.add_picture(img_source, width=Cm(new_width / 37.8))
         
         # Ajouter la légende si présente
         if caption:
             cap_p = doc.add_paragraph(f"Figure: {caption}")
-            apply_para_style(cap_p, config["styles"]["caption"])
+            apply_para_style(cap_p, styles["caption"])
     except Exception as e:
         print(f"Erreur lors de l'ajout de l'image {img_path}: {e}")
         p = doc.add_paragraph(f"[Erreur lors du chargement de l'image: {os.path.basename(img_path)}]")
-        apply_para_style(p, config["styles"]["normal"])
+        apply_para_style(p, styles["normal"])
 
-def add_table_to_doc(doc, table_html, config):
+def add_table_to_doc(doc, table_html, config, styles=None):
     """
     Ajoute un tableau au document Word à partir du HTML
     
@@ -320,6 +616,7 @@ def add_table_to_doc(doc, table_html, config):
         doc (Document): Document Word
         table_html (Tag): Tableau HTML (BeautifulSoup)
         config (dict): Configuration
+        styles (CompiledStyles): Styles compilés (créés depuis config si None)
     """
     # Extraire les lignes et colonnes
     rows = table_html.find_all('tr')
@@ -331,55 +628,103 @@ def add_table_to_doc(doc, table_html, config):
     header_cells = header_row.find_all(['th', 'td'])
     num_cols = len(header_cells)
     
+    # Extraire en une seule passe le texte des cellules et leur rôle d'en-tête
+    # (première ligne ou balise th), sans dépasser le nombre de colonnes
+    rows_data = [
+        [(cell.get_text(strip=True), i == 0 or cell.name == 'th')
+         for cell in row.find_all(['th', 'td'], limit=num_cols)]
+        for i, row in enumerate(rows)
+    ]
+    
+    if styles is None:
+        styles = CompiledStyles(config["styles"])
+    table_style = styles["table"]
+    
+    # Couleur de fond des en-têtes, calculée une seule fois
+    header_bg = table_style["header_bg_color"]
+    header_fill = f"{header_bg['r']:02x}{header_bg['g']:02x}{header_bg['b']:02x}"
+    
     # Créer le tableau Word
     table = doc.add_table(rows=len(rows), cols=num_cols)
     table.style = 'Table Grid'  # Style de base avec bordures
     
-    # Parcourir les lignes et colonnes
-    for i, row in enumerate(rows):
-        cells = row.find_all(['th', 'td'])
-        
-        for j, cell in enumerate(cells):
-            if j < num_cols:  # Éviter les index hors limites
-                # Obtenir le texte de la cellule
-                cell_text = cell.get_text(strip=True)
-                
-                # Appliquer le texte à la cellule
-                word_cell = table.cell(i, j)
-                word_cell.text = cell_text
-                
-                # Appliquer le style
-                for paragraph in word_cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.name = config["styles"]["table"]["font_name"]
-                        run.font.size = Pt(config["styles"]["table"]["font_size"])
-                
-                # Style pour les en-têtes (première ligne)
-                if i == 0 or cell.name == 'th':
-                    for paragraph in word_cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
-                    
-                    # Couleur de fond pour les en-têtes
-                    header_bg = config["styles"]["table"]["header_bg_color"]
-                    shade_cell(word_cell, header_bg["r"], header_bg["g"], header_bg["b"])
+    # Propriétés de run communes, préparées une seule fois par tableau
+    header_rpr = table_run_properties(table_style["font_name"], table_style["font_size"], bold=True)
+    cell_rpr = table_run_properties(table_style["font_name"], table_style["font_size"])
+    
+    # Remplir les cellules Word ligne par ligne (en-têtes en gras avec couleur de fond)
+    for tr, row_data in zip(table._tbl.tr_lst, rows_data):
+        for tc, (cell_text, is_header) in zip(tr.tc_lst, row_data):
+            if is_header:
+                fill_table_cell(tc, cell_text, header_rpr, fill=header_fill)
+            else:
+                fill_table_cell(tc, cell_text, cell_rpr)
     
     # Espace après le tableau
     doc.add_paragraph()
 
-def shade_cell(cell, r, g, b):
+def table_run_properties(font_name, font_size=None, bold=False):
+    """
+    Prépare le XML des propriétés de run (w:rPr) partagées par les cellules d'un tableau
+    
+    Args:
+        font_name (str): Nom de la police
+        font_size (Length): Taille de la police (None pour la taille par défaut)
+        bold (bool): Texte en gras
+        
+    Returns:
+        str: Fragment XML w:rPr à passer à fill_table_cell
+    """
+    font_attr = _esc(font_name)
+    rpr_xml = f'<w:rFonts w:ascii="{font_attr}" w:hAnsi="{font_attr}"/>'
+    if bold:
+        rpr_xml += '<w:b/>'
+    if font_size is not None:
+        rpr_xml += f'<w:sz w:val="{int(font_size.pt * 2)}"/>'
+    return f'<w:rPr>{rpr_xml}</w:rPr>'
+
+def run_content_xml(text):
     """
-    Ajoute une couleur de fond à une cellule de tableau
+    Convertit un texte en contenu XML de run, comme le fait python-docx
+    (tabulations en w:tab, retours à la ligne en w:br)
     
     Args:
-        cell: Cellule de tableau Word
-        r, g, b: Valeurs RGB pour la couleur
+        text (str): Texte du run
+        
+    Returns:
+        str: Fragment XML à placer dans un élément w:r
     """
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), f"{r:02x}{g:02x}{b:02x}")
-    cell._tc.get_or_add_tcPr().append(shading)
+    parts = []
+    for chunk in _RUN_BREAK_RE.split(text):
+        if chunk == '\t':
+            parts.append('<w:tab/>')
+        elif chunk == '\n' or chunk == '\r':
+            parts.append('<w:br/>')
+        elif chunk:
+            space = ' xml:space="preserve"' if chunk != chunk.strip() else ''
+            parts.append(f'<w:t{space}>{_esc(chunk)}</w:t>')
+    return ''.join(parts)
 
-def add_list_to_doc(doc, list_html, config, list_type=None, level=0):
+def fill_table_cell(tc, text, rpr_xml, fill=None):
+    """
+    Remplit une cellule de tableau avec un seul paragraphe construit en une
+    seule analyse XML (un run déjà mis en forme)
+    
+    Args:
+        tc: Élément w:tc de la cellule
+        text (str): Texte de la cellule
+        rpr_xml (str): Propriétés du run (voir table_run_properties)
+        fill (str): Couleur de fond hexadécimale (ex: 'f0f0f0'), None pour aucune
+    """
+    # Vider la cellule (les propriétés w:tcPr sont conservées)
+    tc.clear_content()
+    
+    if fill:
+        tc.get_or_add_tcPr().append(OxmlElement('w:shd', {_QN_FILL: fill}))
+    
+    tc.append(parse_xml(f'<w:p {_W_NSDECL}><w:r>{rpr_xml}{run_content_xml(text)}</w:r></w:p>'))
+
+def add_list_to_doc(doc, list_html, config, list_type=None, level=0, styles=None):
     """
     Ajoute une liste (ordonnée ou non) au document Word
     
@@ -389,7 +734,11 @@ def add_list_to_doc(doc, list_html, config, list_type=None, level=0):
         config (dict): Configuration
         list_type (str): Type de liste ('ol' ou 'ul')
         level (int): Niveau d'indentation
+        styles (CompiledStyles): Styles compilés (créés depuis config si None)
     """
+    if styles is None:
+        styles = CompiledStyles(config["styles"])
+    
     if not list_type:
         list_type = list_html.name  # 'ol' ou 'ul'
     
@@ -397,15 +746,11 @@ def add_list_to_doc(doc, list_html, config, list_type=None, level=0):
     
     for item in items:
         # Texte de l'élément (sans les sous-listes)
-        item_text = ''
-        for content in item.contents:
-            if content.name not in ['ol', 'ul']:
-                if hasattr(content, 'get_text'):
-                    item_text += content.get_text()
-                else:
-                    item_text += str(content)
-        
-        item_text = item_text.strip()
+        item_text = ''.join(
+            content.get_text() if hasattr(content, 'get_text') else str(content)
+            for content in item.contents
+            if content.name not in _LIST_TAGS
+        ).strip()
         
         # Créer un paragraphe pour l'élément de liste
         p = doc.add_paragraph()
@@ -416,11 +761,11 @@ def add_list_to_doc(doc, list_html, config, list_type=None, level=0):
         
         # Ajouter le texte de l'élément
         run = p.add_run(item_text)
-        apply_style(run, config["styles"]["list_item"])
+        apply_style(run, styles["list_item"])
         
         # Traiter les sous-listes récursivement
-        for sub_list in item.find_all(['ol', 'ul'], recursive=False):
-            add_list_to_doc(doc, sub_list, config, sub_list.name, level + 1)
+        for sub_list in item.find_all(_LIST_TAGS, recursive=False):
+            add_list_to_doc(doc, sub_list, config, sub_list.name, level + 1, styles)
 
 def add_header_footer(section, header_text, footer_text, config, chapter_title):
     """
@@ -433,54 +778,62 @@ def add_header_footer(section, header_text, footer_text, config, chapter_title):
         config (dict): Configuration
         chapter_title (str): Titre du chapitre
     """
+    doc_config = config["document"]
+    
     # En-tête
-    if config["document"]["header"]["enabled"]:
-        header = section.header
-        
-        # S'assurer qu'il y a au moins un paragraphe
-        if not header.paragraphs:
-            p = header.add_paragraph()
-        else:
-            p = header.paragraphs[0]
-            p.clear()  # Vider le contenu existant
+    if doc_config["header"]["enabled"]:
+        p = reset_header_footer_paragraph(section.header)
         
         # Ajouter le contenu
-        p.text = header_text.replace("{chapter}", chapter_title)
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        r = OxmlElement('w:r')
+        r.text = header_text.replace("{chapter}", chapter_title)
+        p.append(r)
     
     # Pied de page
-    if config["document"]["footer"]["enabled"]:
-        footer = section.footer
-        
-        # S'assurer qu'il y a au moins un paragraphe
-        if not footer.paragraphs:
-            p = footer.add_paragraph()
-        else:
-            p = footer.paragraphs[0]
-            p.clear()  # Vider le contenu existant
+    if doc_config["footer"]["enabled"]:
+        p = reset_header_footer_paragraph(section.footer)
         
         # Ajouter le texte statique
-        p.text = footer_text.replace("{page}", "")
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        r = OxmlElement('w:r')
+        r.text = footer_text.replace("{page}", "")
+        p.append(r)
         
         # Ajouter le numéro de page en utilisant un champ
-        run = p.add_run()
-        fldChar1 = OxmlElement('w:fldChar')
-        fldChar1.set(qn('w:fldCharType'), 'begin')
-        
         instrText = OxmlElement('w:instrText')
-        instrText.set(qn('xml:space'), 'preserve')
+        instrText.set(_QN_XMLSPACE, 'preserve')
         instrText.text = "PAGE"
         
-        fldChar2 = OxmlElement('w:fldChar')
-        fldChar2.set(qn('w:fldCharType'), 'end')
+        r = OxmlElement('w:r')
+        r.append(create_field_char('begin'))
+        r.append(instrText)
+        r.append(create_field_char('end'))
+        p.append(r)
+
+def reset_header_footer_paragraph(header_footer):
+    """
+    Retourne le premier paragraphe d'un en-tête ou pied de page, vidé de son
+    contenu et centré, prêt à recevoir de nouveaux runs
+    
+    Args:
+        header_footer: En-tête ou pied de page d'une section Word
         
-        run._r.append(fldChar1)
-        run._r.append(instrText)
-        run._r.append(fldChar2)
+    Returns:
+        CT_P: Élément w:p du paragraphe
+    """
+    element = header_footer._element
+    
+    # S'assurer qu'il y a au moins un paragraphe
+    if element.p_lst:
+        p = element.p_lst[0]
+        p.clear_content()  # Vider le contenu existant (le style est conservé)
+    else:
+        p = element.add_p()
+    
+    p.get_or_add_pPr().jc_val = WD_ALIGN_PARAGRAPH.CENTER
+    return p
 
 
-def add_section_with_settings(doc, config, chapter_title):
+def add_section_with_settings(doc, config, chapter_title, page_setup=None):
     """
     Ajoute une nouvelle section avec les paramètres de page configurés
     
@@ -488,84 +841,95 @@ def add_section_with_settings(doc, config, chapter_title):
         doc (Document): Document Word
         config (dict): Configuration
         chapter_title (str): Titre du chapitre actuel
+        page_setup (dict, optional): Dimensions de page et marges déjà
+            calculées par get_page_setup, réutilisées d'une section à l'autre
         
     Returns:
         section: Nouvelle section ajoutée
     """
+    doc_config = config["document"]
+    header_config = doc_config["header"]
+    footer_config = doc_config["footer"]
+    
     section = doc.add_section(WD_SECTION.NEW_PAGE)
     
     # Orientation
-    if config["document"]["orientation"].lower() == "landscape":
+    if doc_config["orientation"].lower() == "landscape":
         section.orientation = WD_ORIENT.LANDSCAPE
     else:
         section.orientation = WD_ORIENT.PORTRAIT
     
-    # Taille de page
-    section.page_width = Cm(config["document"]["page_size"]["width"])
-    section.page_height = Cm(config["document"]["page_size"]["height"])
-    
-    # Marges
-    section.top_margin = Cm(config["document"]["margins"]["top"])
-    section.bottom_margin = Cm(config["document"]["margins"]["bottom"])
-    section.left_margin = Cm(config["document"]["margins"]["left"])
-    section.right_margin = Cm(config["document"]["margins"]["right"])
+    # Taille de page et marges
+    if page_setup is None:
+        page_setup = get_page_setup(config)
+    apply_page_setup(section, page_setup)
     
     # En-têtes et pieds de page
-    if config["document"]["header"]["enabled"] or config["document"]["footer"]["enabled"]:
+    if header_config["enabled"] or footer_config["enabled"]:
         # Page différente pour la première page si configurée
         section.different_first_page_header_footer = (
-            config["document"]["header"]["first_page_different"] or 
-            config["document"]["footer"]["first_page_different"]
+            header_config["first_page_different"] or 
+            footer_config["first_page_different"]
         )
         
-        header_text = config["document"]["header"]["content"]
-        footer_text = config["document"]["footer"]["content"]
+        header_text = header_config["content"]
+        footer_text = footer_config["content"]
         
         add_header_footer(section, header_text, footer_text, config, chapter_title)
     
     return section
 
-def generate_toc(doc, config):
+def create_field_char(field_char_type):
+    """
+    Crée un élément w:fldChar délimitant un champ Word
+    
+    Args:
+        field_char_type (str): Type de délimiteur ('begin', 'separate' ou 'end')
+        
+    Returns:
+        OxmlElement: Élément w:fldChar
+    """
+    return OxmlElement('w:fldChar', {_QN_FLDCHARTYPE: field_char_type})
+
+def generate_toc(doc, config, styles=None):
     """
     Génère une table des matières
     
     Args:
         doc (Document): Document Word
         config (dict): Configuration
+        styles (CompiledStyles): Styles compilés (créés depuis config si None)
     """
-    if not config["document"]["generate_toc"]:
+    doc_config = config["document"]
+    
+    if not doc_config["generate_toc"]:
         return
     
     print("Génération de la table des matières...")
     
     # Ajouter un titre pour la table des matières
-    heading = doc.add_heading(config["document"]["toc_title"], level=1)
-    apply_heading_style(heading, config["styles"]["toc_heading"])
+    heading = doc.add_heading(doc_config["toc_title"], level=1)
+    if styles is None:
+        styles = CompiledStyles(config["styles"])
+    apply_heading_style(heading, styles["toc_heading"])
     
     # Ajouter un paragraphe pour la TOC
     par = doc.add_paragraph()
     
     # Méthode plus stable pour ajouter un champ TOC
     run = par.add_run()
-    fldChar = OxmlElement('w:fldChar')
-    fldChar.set(qn('w:fldCharType'), 'begin')
-    run._r.append(fldChar)
+    run._r.append(create_field_char('begin'))
     
     instr = OxmlElement('w:instrText')
-    instr.set(qn('xml:space'), 'preserve')
+    instr.set(_QN_XMLSPACE, 'preserve')
     instr.text = 'TOC \\o "1-3" \\h \\z'
     run._r.append(instr)
     
-    fldChar = OxmlElement('w:fldChar')
-    fldChar.set(qn('w:fldCharType'), 'separate')
-    run._r.append(fldChar)
+    run._r.append(create_field_char('separate'))
     
     # Texte par défaut qui sera remplacé lors de la mise à jour
     run = par.add_run("Table des matières (Cliquez-droit et sélectionnez 'Mettre à jour les champs' pour générer)")
-    
-    fldChar = OxmlElement('w:fldChar')
-    fldChar.set(qn('w:fldCharType'), 'end')
-    run._r.append(fldChar)
+    run._r.append(create_field_char('end'))
     
     # Ajouter une page après la TOC
     doc.add_page_break()
@@ -579,13 +943,13 @@ def apply_style(run, style):
     
     Args:
         run: L'élément Run (texte) à styliser
-        style (dict): Dictionnaire contenant les propriétés de style
+        style (dict): Style compilé (voir compile_style)
     """
     if "font_name" in style:
         run.font.name = style["font_name"]
         
     if "font_size" in style:
-        run.font.size = Pt(style["font_size"])
+        run.font.size = style["font_size"]
         
     if "bold" in style:
         run.bold = style["bold"]
@@ -594,10 +958,7 @@ def apply_style(run, style):
         run.italic = style["italic"]
         
     if "color" in style:
-        r = style["color"].get("r", 0)
-        g = style["color"].get("g", 0)
-        b = style["color"].get("b", 0)
-        run.font.color.rgb = RGBColor(r, g, b)
+        run.font.color.rgb = style["color"]
 
 def apply_para_style(paragraph, style):
     """
@@ -605,7 +966,7 @@ def apply_para_style(paragraph, style):
     
     Args:
         paragraph: Le paragraphe à styliser
-        style (dict): Dictionnaire contenant les propriétés de style
+        style (dict): Style compilé (voir compile_style)
     """
     # Appliquer le style à chaque Run dans le paragraphe
     for run in paragraph.runs:
@@ -613,10 +974,10 @@ def apply_para_style(paragraph, style):
     
     # Appliquer les propriétés spécifiques aux paragraphes
     if "space_before" in style:
-        paragraph.paragraph_format.space_before = Pt(style["space_before"])
+        paragraph.paragraph_format.space_before = style["space_before"]
         
     if "space_after" in style:
-        paragraph.paragraph_format.space_after = Pt(style["space_after"])
+        paragraph.paragraph_format.space_after = style["space_after"]
         
     if "line_spacing" in style:
         paragraph.paragraph_format.line_spacing = style["line_spacing"]
@@ -625,14 +986,7 @@ def apply_para_style(paragraph, style):
         paragraph.paragraph_format.keep_with_next = style["keep_with_next"]
         
     if "alignment" in style:
-        alignment_map = {
-            "left": WD_ALIGN_PARAGRAPH.LEFT,
-            "center": WD_ALIGN_PARAGRAPH.CENTER,
-            "right": WD_ALIGN_PARAGRAPH.RIGHT,
-            "justify": WD_ALIGN_PARAGRAPH.JUSTIFY
-        }
-        if style["alignment"] in alignment_map:
-            paragraph.paragraph_format.alignment = alignment_map[style["alignment"]]
+        paragraph.paragraph_format.alignment = style["alignment"]
 
 def apply_heading_style(heading, style):
     """
@@ -640,12 +994,104 @@ def apply_heading_style(heading, style):
     
     Args:
         heading: L'élément Heading à styliser
-        style (dict): Dictionnaire contenant les propriétés de style
+        style (dict): Style compilé (voir compile_style)
     """
+    # apply_para_style applique déjà le style à chaque run du titre
     apply_para_style(heading, style)
+
+def element_xml(element):
+    """
+    Sérialise un élément XML pour l'insérer dans un fragment construit en texte
     
-    for run in heading.runs:
+    Args:
+        element: Élément à sérialiser (None accepté)
+        
+    Returns:
+        str: XML de l'élément sans déclaration d'espace de noms, '' si None
+    """
+    if element is None:
+        return ''
+    return etree.tostring(element, encoding='unicode').replace(f' {_W_NSDECL}', '')
+
+def run_properties_xml(format_type, *styles):
+    """
+    Calcule le XML w:rPr d'un run de texte formaté : le formatage inline puis
+    chacun des styles sont appliqués dans l'ordre sur un run temporaire, comme
+    ils le seraient sur un run du document
+    
+    Args:
+        format_type (str): Type de formatage inline (voir _parse_inline)
+        *styles (dict): Styles compilés appliqués successivement
+        
+    Returns:
+        str: Fragment XML w:rPr ('' si le run n'a aucune propriété)
+    """
+    r = OxmlElement('w:r')
+    run = Run(r, None)
+    
+    if format_type == 'bold':
+        run.bold = True
+    elif format_type == 'italic':
+        run.italic = True
+    elif format_type == 'link':
+        run.underline = True
+    
+    for style in styles:
         apply_style(run, style)
+    
+    return element_xml(r.rPr)
+
+def heading_properties_xml(style_id, style=None):
+    """
+    Calcule les XML w:pPr et w:rPr d'un titre en appliquant son style Word et
+    son style de configuration à un titre temporaire, comme sur un titre du document
+    
+    Args:
+        style_id (str): Identifiant du style Word du titre (ex: 'Heading1')
+        style (dict): Style compilé du niveau de titre (None si non configuré)
+        
+    Returns:
+        tuple: (XML w:pPr du paragraphe, XML w:rPr du run de texte)
+    """
+    heading = Paragraph(OxmlElement('w:p'), None)
+    heading._p.style = style_id
+    run = heading.add_run()
+    
+    if style is not None:
+        apply_heading_style(heading, style)
+    
+    return element_xml(heading._p.pPr), element_xml(run._r.rPr)
+
+def heading_xml(text, heading_properties):
+    """
+    Construit le XML complet d'un titre à partir de ses propriétés précalculées
+    
+    Args:
+        text (str): Texte du titre
+        heading_properties (tuple): Propriétés retournées par heading_properties_xml
+        
+    Returns:
+        str: XML de l'élément w:p
+    """
+    paragraph_properties, run_properties = heading_properties
+    run_xml = f'<w:r>{run_properties}{run_content_xml(text)}</w:r>' if text else ''
+    return f'<w:p {_W_NSDECL}>{paragraph_properties}{run_xml}</w:p>'
+
+def formatted_runs_xml(formatted_runs, run_properties):
+    """
+    Construit le XML des runs d'un paragraphe à partir des portions formatées
+    
+    Args:
+        formatted_runs (list): Tuples (type, texte) produits par _parse_inline
+        run_properties (dict): XML w:rPr précalculé pour chaque type de formatage
+        
+    Returns:
+        str: Fragment XML des éléments w:r
+    """
+    return ''.join([
+        f'<w:r>{run_properties[format_type]}{run_content_xml(text)}</w:r>'
+        for format_type, text in formatted_runs
+    ])
 
 def extract_chapter_title(md_content):
     """
@@ -658,11 +1104,363 @@ def extract_chapter_title(md_content):
         str: Titre du chapitre ou nom de fichier par défaut
     """
     # Chercher le premier titre h1
-    h1_match = re.search(r'^#\s+(.+)$', md_content, re.MULTILINE)
+    h1_match = _CHAPTER_RE.search(md_content)
     if h1_match:
         return h1_match.group(1).strip()
     return "Chapitre"
 
+def _parse_inline(text):
+    """
+    Découpe une ligne en portions de texte selon le formatage inline Markdown
+    
+    La ligne est parcourue une seule fois : on saute directement au prochain
+    caractère ouvrant, puis on cherche le délimiteur fermant. À une même
+    position, le gras l'emporte sur l'italique ; un délimiteur sans fermeture
+    est traité comme du texte normal.
+    
+    Args:
+        text (str): Ligne à analyser (sans retour à la ligne)
+        
+    Returns:
+        list: Liste de tuples (type, texte) avec type parmi 'normal', 'bold',
+              'italic', 'code' et 'link'
+    """
+    # Cas le plus fréquent : aucun caractère ouvrant (voir _INLINE_OPENERS), la
+    # ligne est une seule portion de texte normal (tests 'in' exécutés en C)
+    if '*' not in text and '_' not in text and '`' not in text and '[' not in text:
+        return [('normal', text)] if text else []
+    
+    formatted_runs = []
+    length = len(text)
+    last = 0  # Début du texte normal pas encore ajouté
+    
+    # Prochaine position de chaque caractère ouvrant (length si absent)
+    positions = [text.find(opener) for opener in _INLINE_OPENERS]
+    positions = [length if pos < 0 else pos for pos in positions]
+    
+    while True:
+        i = min(positions)
+        if i >= length:
+            break
+        
+        char = text[i]
+        end = -1
+        
+        if char == '*' or char == '_':
+            if text.startswith(char, i + 1):
+                # Texte en gras: **texte** ou __texte__
+                close = text.find(char * 2, i + 2)
+                if close >= 0:
+                    match_type, content, end = 'bold', text[i + 2:close], close + 2
+            else:
+                # Texte en italique: *texte* ou _texte_
+                close = text.find(char, i + 1)
+                if close >= 0:
+                    match_type, content, end = 'italic', text[i + 1:close], close + 1
+        elif char == '`':
+            # Code inline: `texte`
+            close = text.find('`', i + 1)
+            if close >= 0:
+                match_type, content, end = 'code', text[i + 1:close], close + 1
+        else:
+            # Lien: [texte](url)
+            middle = text.find('](', i + 1)
+            if middle >= 0:
+                close = text.find(')', middle + 2)
+                if close >= 0:
+                    match_type, content, end = 'link', text[i + 1:middle], close + 1
+        
+        if end < 0:
+            # Délimiteur sans fermeture : il reste dans le texte normal
+            end = i + 1
+        else:
+            # Ajouter le texte avant le match, puis le match avec son style
+            if i > last:
+                formatted_runs.append(('normal', text[last:i]))
+            formatted_runs.append((match_type, content))
+            last = end
+        
+        # Avancer les positions dépassées jusqu'au prochain caractère ouvrant
+        for index, pos in enumerate(positions):
+            if pos < end:
+                pos = text.find(_INLINE_OPENERS[index], end)
+                positions[index] = length if pos < 0 else pos
+    
+    # Ajouter le texte restant après le dernier match
+    if last < length:
+        formatted_runs.append(('normal', text[last:]))
+    
+    return formatted_runs
+
+class BufferedDocument:
+    """
+    Enveloppe d'un Document Word qui ajoute les paragraphes et tableaux à la fin
+    du corps du document, puis replace le w:sectPr final en une seule opération.
+    
+    python-docx insère chaque bloc avant le w:sectPr final en parcourant les
+    enfants du corps : chaque ajout coûte d'autant plus cher que le document est
+    long. Ici, les blocs sont simplement ajoutés en fin de corps et le w:sectPr
+    est remis à la dernière place lors de flush(), appelée avant chaque nouvelle
+    section et à l'enregistrement.
+    """
+    
+    def __init__(self, document):
+        self.document = document
+        self._body = document._body
+        self._sectPr_moved = False
+    
+    @property
+    def sections(self):
+        return self.document.sections
+    
+    @property
+    def styles(self):
+        return self.document.styles
+    
+    def _append(self, element):
+        self._body._element.append(element)
+        self._sectPr_moved = True
+    
+    def add_paragraph(self, text='', style=None):
+        paragraph = Paragraph(OxmlElement('w:p'), self._body)
+        self._append(paragraph._p)
+        if text:
+            paragraph.add_run(text)
+        if style is not None:
+            paragraph.style = style
+        return paragraph
+    
+    def add_paragraph_xml(self, xml):
+        """Ajoute un paragraphe construit à partir du XML complet de son élément w:p"""
+        paragraph = Paragraph(parse_xml(xml), self._body)
+        self._append(paragraph._p)
+        return paragraph
+    
+    def add_heading(self, text='', level=1):
+        if not 0 <= level <= 9:
+            raise ValueError(f"level must be in range 0-9, got {level}")
+        style = "Title" if level == 0 else f"Heading {level}"
+        return self.add_paragraph(text, style)
+    
+    def add_page_break(self):
+        paragraph = self.add_paragraph()
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        return paragraph
+    
+    def add_table(self, rows, cols, style=None):
+        table = Table(CT_Tbl.new_tbl(rows, cols, self.document._block_width), self._body)
+        self._append(table._tbl)
+        table.style = style
+        return table
+    
+    def add_section(self, start_type=WD_SECTION.NEW_PAGE):
+        self.flush()
+        return self.document.add_section(start_type)
+    
+    def flush(self):
+        """Remet le w:sectPr final en dernière position du corps du document"""
+        if not self._sectPr_moved:
+            return
+        
+        body = self._body._element
+        sectPr = body.sectPr
+        if sectPr is not None:
+            body.append(sectPr)
+        
+        self._sectPr_moved = False
+    
+    def save(self, path):
+        self.flush()
+        self.document.save(path)
+
+class _Peekable:
+    """
+    Itérateur permettant de consulter l'élément suivant sans le consommer
+    """
+    
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self._peeked = None
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        if self._peeked is not None:
+            item, self._peeked = self._peeked, None
+            return item
+        return next(self._iterator)
+    
+    def peek(self):
+        """
+        Retourne l'élément suivant sans le consommer
+        
+        Returns:
+            L'élément suivant, ou None en fin d'itération
+        """
+        if self._peeked is None:
+            self._peeked = next(self._iterator, None)
+        return self._peeked
+
+def parse_markdown(md_content):
+    """
+    Analyse un contenu Markdown en une liste d'opérations à appliquer au document
+    
+    Les opérations sont des tuples dont le premier élément donne le type :
+    ('code', langage, texte), ('heading', niveau, texte),
+    ('list', type de liste, niveau, portions), ('table', en-tête, lignes),
+    ('image', texte alternatif, chemin), ('blank',) et ('text', portions),
+    les portions étant celles produites par _parse_inline.
+    
+    Args:
+        md_content (str): Contenu Markdown
+        
+    Returns:
+        list: Opérations dans l'ordre du document
+    """
+    ops = []
+    table_lines = []  # Liste de travail réutilisée d'un tableau à l'autre
+    
+    # Parcours des lignes ; la ligne suivante peut être consultée sans être consommée
+    lines_iter = _Peekable(md_content.split('\n'))
+    
+    for line in lines_iter:
+        stripped = line.strip()
+        
+        # Premier caractère significatif : il suffit à écarter la plupart des
+        # cas, si bien que le texte normal ne passe par aucune expression régulière
+        first_char = stripped[:1]
+        
+        # Détection des blocs de code avec triple backticks
+        if first_char == '`' and stripped.startswith('```'):
+            # Récupérer le langage (ex: ```python)
+            code_language = stripped[3:].strip()
+            
+            # Consommer les lignes du bloc jusqu'au délimiteur de fin : takewhile
+            # les transmet directement à join et consomme le délimiteur, dont la
+            # présence est notée pour reconnaître un bloc non fermé
+            fence_closed = False
+            
+            def in_code_block(code_line):
+                nonlocal fence_closed
+                fence_closed = code_line.strip().startswith('```')
+                return not fence_closed
+            
+            code_text = '\n'.join(takewhile(in_code_block, lines_iter))
+            if not fence_closed:
+                # Bloc de code non fermé : ignoré
+                continue
+            
+            ops.append(('code', code_language, code_text))
+            continue
+        
+        # Traitement des titres (h1 à h6) : la plupart des lignes ne commencent
+        # pas par '#', ce test évite alors de lancer l'expression régulière
+        header_match = _HEADER_RE.match(line) if line.startswith('#') else None
+        if header_match:
+            ops.append(('heading', len(header_match.group(1)), header_match.group(2).strip()))
+            continue
+        
+        # Traitement des éléments de liste (marqueur *, -, + ou numéro)
+        if first_char in _BULLET_MARKERS or first_char.isdecimal():
+            list_match = _LIST_RE.match(line)
+        else:
+            list_match = None
+        if list_match:
+            indentation = len(list_match.group(1))
+            list_marker = list_match.group(2)
+            
+            # Type de liste et niveau d'indentation
+            list_type = 'ul' if list_marker in _BULLET_MARKERS else 'ol'
+            ops.append(('list', list_type, indentation // 2, _parse_inline(list_match.group(3))))
+            continue
+        
+        # Traitement des tableaux (syntaxe markdown)
+        if first_char == '|' and stripped.endswith('|'):
+            # Collecte des lignes de tableau
+            table_lines.clear()
+            table_lines.append(line)
+            while (next_line := lines_iter.peek()) is not None:
+                next_stripped = next_line.strip()
+                if not (next_stripped.startswith('|') and next_stripped.endswith('|')):
+                    break
+                table_lines.append(next(lines_iter))
+            
+            # S'assurer qu'il y a au moins un séparateur et une ligne de données
+            if len(table_lines) >= 3:
+                # Extraction des cellules : chaque ligne commence et finit par '|'
+                # (hors espaces), les cellules sont donc les morceaux intérieurs
+                header_row = list(map(str.strip, table_lines[0].split('|')[1:-1]))
+                if not header_row:
+                    # En-tête réduit à '|' : une colonne vide, un tableau Word
+                    # devant avoir au moins une cellule par ligne
+                    header_row = ['']
+                
+                # Ignorer la ligne de séparation (---|---|...)
+                rows_data = [list(map(str.strip, table_line.split('|')[1:-1]))
+                             for table_line in table_lines[2:]]
+                ops.append(('table', header_row, rows_data))
+            continue
+        
+        # Détection d'images markdown ![alt](url)
+        img_match = _IMG_RE.match(line) if line.startswith('!') else None
+        if img_match:
+            ops.append(('image', img_match.group(1), img_match.group(2)))
+            continue
+        
+        # Si ligne vide ou seulement des espaces
+        if not stripped:
+            ops.append(('blank',))
+            continue
+        
+        # Texte normal avec formatage inline
+        ops.append(('text', _parse_inline(line)))
+    
+    return ops
+
+def _parse_file_to_ops(input_file):
+    """
+    Lit et analyse un fichier Markdown
+    
+    Args:
+        input_file (str): Chemin du fichier Markdown
+        
+    Returns:
+        tuple: (titre du chapitre, opérations produites par parse_markdown)
+    """
+    md_content = Path(input_file).read_text(encoding='utf-8')
+    return extract_chapter_title(md_content), parse_markdown(md_content)
+
+def parse_markdown_files(input_files, prefetch=4):
+    """
+    Lit et analyse les fichiers Markdown dans l'ordre ; les fichiers suivants
+    sont lus en avance dans des threads pendant le traitement du fichier courant
+    
+    Args:
+        input_files (list): Liste des chemins vers les fichiers Markdown
+        prefetch (int): Nombre maximal de fichiers lus en avance
+        
+    Yields:
+        tuple: (chemin du fichier, titre du chapitre, opérations)
+    """
+    remaining_files = iter(input_files)
+    
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = deque()
+        
+        def submit_next():
+            input_file = next(remaining_files, None)
+            if input_file is not None:
+                pending.append((input_file, executor.submit(_parse_file_to_ops, input_file)))
+        
+        for _ in range(prefetch):
+            submit_next()
+        
+        while pending:
+            input_file, future = pending.popleft()
+            submit_next()
+            yield (input_file, *future.result())
+
 def convert_markdown_to_docx(input_files, output_file, config_file=None):
     """
     Convertit un ou plusieurs fichiers Markdown en un document Word (.docx)
@@ -674,414 +1472,198 @@ def convert_markdown_to_docx(input_files, output_file, config_file=None):
     """
     # Charger la configuration
     config = load_config(config_file)
+    styles = CompiledStyles(config["styles"])
+    page_setup = get_page_setup(config)
+    
+    # Paramètres du document utilisés pour chaque fichier
+    doc_config = config["document"]
+    header_text = doc_config["header"]["content"]
+    footer_text = doc_config["footer"]["content"]
+    use_header_footer = doc_config["header"]["enabled"] or doc_config["footer"]["enabled"]
+    first_page_different = (
+        doc_config["header"]["first_page_different"] or 
+        doc_config["footer"]["first_page_different"]
+    )
     
-    # Créer un nouveau document Word
-    doc = Document()
+    # Images distantes téléchargées pendant cette conversion (URL -> contenu)
+    image_cache = {}
+    
+    # Créer un nouveau document Word (les blocs y sont insérés par lots)
+    doc = BufferedDocument(Document())
+    
+    # Propriétés XML précalculées à la première utilisation, afin qu'un style
+    # absent du document (titre h5, tableau, liste...) ne soit jamais compilé :
+    # les runs d'un paragraphe normal reçoivent leur style puis celui du
+    # paragraphe, ceux d'une liste uniquement leur style
+    normal_run_properties = _LazyDict(lambda format_type: run_properties_xml(
+        format_type, styles["code" if format_type == 'code' else "normal"], styles["normal"]))
+    list_run_properties = _LazyDict(lambda format_type: run_properties_xml(
+        format_type, styles["code" if format_type == 'code' else "list_item"]))
+    normal_paragraph_properties = None
+    list_paragraph_properties = {}  # (type de liste, niveau) -> XML w:pPr
+    list_indents = None
+    heading_properties = _LazyDict(lambda level: heading_properties_xml(
+        doc.styles[f"Heading {level}"].style_id, styles.get(f"h{level}")))
+    table_properties = None  # (fond de l'en-tête, rPr de l'en-tête, rPr des cellules)
     
     # Appliquer les paramètres de page initiaux
     first_section = doc.sections[0]
-    first_section.page_width = Cm(config["document"]["page_size"]["width"])
-    first_section.page_height = Cm(config["document"]["page_size"]["height"])
-    first_section.top_margin = Cm(config["document"]["margins"]["top"])
-    first_section.bottom_margin = Cm(config["document"]["margins"]["bottom"])
-    first_section.left_margin = Cm(config["document"]["margins"]["left"])
-    first_section.right_margin = Cm(config["document"]["margins"]["right"])
+    apply_page_setup(first_section, page_setup)
     
     # Générer la table des matières en premier si demandé
-    if config["document"]["generate_toc"]:
+    if doc_config["generate_toc"]:
         # Configuration de la section pour la table des matières
         toc_section = first_section
-        toc_section.different_first_page_header_footer = (
-            config["document"]["header"]["first_page_different"] or 
-            config["document"]["footer"]["first_page_different"]
-        )
+        toc_section.different_first_page_header_footer = first_page_different
         
         # Appliquer l'en-tête et le pied de page à la section de la table des matières
-        if config["document"]["header"]["enabled"] or config["document"]["footer"]["enabled"]:
-            header_text = config["document"]["header"]["content"]
-            footer_text = config["document"]["footer"]["content"]
-            add_header_footer(toc_section, header_text, footer_text, config, config["document"]["toc_title"])
-        
-        # Ajouter un titre pour la table des matières
-        heading = doc.add_heading(config["document"]["toc_title"], level=1)
-        apply_heading_style(heading, config["styles"]["toc_heading"])
-        
-        # Ajouter un paragraphe pour la TOC
-        par = doc.add_paragraph()
-        
-        # Méthode plus stable pour ajouter un champ TOC
-        run = par.add_run()
-        fldChar = OxmlElement('w:fldChar')
-        fldChar.set(qn('w:fldCharType'), 'begin')
-        run._r.append(fldChar)
-        
-        instr = OxmlElement('w:instrText')
-        instr.set(qn('xml:space'), 'preserve')
-        instr.text = 'TOC \\o "1-3" \\h \\z'
-        run._r.append(instr)
-        
-        fldChar = OxmlElement('w:fldChar')
-        fldChar.set(qn('w:fldCharType'), 'separate')
-        run._r.append(fldChar)
-        
-        # Texte par défaut qui sera remplacé lors de la mise à jour
-        run = par.add_run("Table des matières (Cliquez-droit et sélectionnez 'Mettre à jour les champs' pour générer)")
-        
-        fldChar = OxmlElement('w:fldChar')
-        fldChar.set(qn('w:fldCharType'), 'end')
-        run._r.append(fldChar)
-        
-        # Ajouter une page après la TOC
-        doc.add_page_break()
+        if use_header_footer:
+            add_header_footer(toc_section, header_text, footer_text, config, doc_config["toc_title"])
         
-        print("Table des matières ajoutée. Ouvrez le document et mettez à jour la table pour l'afficher correctement.")
+        # Ajouter la table des matières
+        generate_toc(doc, config, styles)
     
-    # Traiter chaque fichier Markdown
-    for index, input_file in enumerate(input_files):
-        # Lire le contenu du fichier Markdown
-        with open(input_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        
-        # Extraire le titre du chapitre
-        chapter_title = extract_chapter_title(md_content)
+    # Traiter chaque fichier Markdown (les suivants sont lus et analysés en avance)
+    for index, (input_file, chapter_title, ops) in enumerate(parse_markdown_files(input_files)):
         file_name = os.path.basename(input_file)
         
         print(f"Traitement du fichier: {file_name} (chapitre: {chapter_title})")
         
         # Ajouter une nouvelle section pour chaque fichier (sauf pour le tout premier si TOC n'est pas générée)
-        if index > 0 or config["document"]["generate_toc"]:
+        if index > 0 or doc_config["generate_toc"]:
             # Ajouter un saut de page entre les chapitres si nécessaire
-            if config["document"]["page_break_between_files"]:
+            if doc_config["page_break_between_files"]:
                 doc.add_page_break()
             
             # Créer une nouvelle section
             section = doc.add_section(WD_SECTION.NEW_PAGE)
             
             # Configurer les paramètres de page pour cette section
-            section.page_width = Cm(config["document"]["page_size"]["width"])
-            section.page_height = Cm(config["document"]["page_size"]["height"])
-            section.top_margin = Cm(config["document"]["margins"]["top"])
-            section.bottom_margin = Cm(config["document"]["margins"]["bottom"])
-            section.left_margin = Cm(config["document"]["margins"]["left"])
-            section.right_margin = Cm(config["document"]["margins"]["right"])
+            apply_page_setup(section, page_setup)
             
             # Configurer l'option pour différencier la première page
-            section.different_first_page_header_footer = (
-                config["document"]["header"]["first_page_different"] or 
-                config["document"]["footer"]["first_page_different"]
-            )
+            section.different_first_page_header_footer = first_page_different
         else:
             # Utiliser la première section déjà existante
             section = doc.sections[0]
         
         # Appliquer immédiatement les en-têtes et pieds de page pour cette section
-        if config["document"]["header"]["enabled"] or config["document"]["footer"]["enabled"]:
-            header_text = config["document"]["header"]["content"]
-            footer_text = config["document"]["footer"]["content"]
+        if use_header_footer:
             add_header_footer(section, header_text, footer_text, config, chapter_title)
         
         # Obtenir le chemin de base pour les images relatives
         base_path = os.path.dirname(os.path.abspath(input_file))
         
-        # Ajouter le nom du fichier comme titre (optionnel)
-        if config["document"]["add_file_headers"]:
-            file_header = doc.add_heading(f"Fichier: {file_name}", level=1)
-            apply_heading_style(file_header, config["styles"]["h1"])
-        
-        # Traitement direct du Markdown
-        lines = md_content.split('\n')
-        i = 0
+        # Télécharger en parallèle les images distantes du fichier
+        prefetch_remote_images([op[2] for op in ops if op[0] == 'image'], image_cache)
         
-        in_code_block = False
-        code_language = None
-        code_content = []
+        # Ajouter le nom du fichier comme titre (optionnel)
+        if doc_config["add_file_headers"]:
+            doc.add_paragraph_xml(heading_xml(f"Fichier: {file_name}", heading_properties[1]))
         
-        while i < len(lines):
-            line = lines[i]
+        # Appliquer les opérations issues de l'analyse du Markdown
+        for op in ops:
+            kind = op[0]
             
-            # Détection des blocs de code avec triple backticks
-            if line.strip().startswith('```'):
-                if not in_code_block:
-                    # Début du bloc de code
-                    in_code_block = True
-                    # Récupérer le langage (ex: ```python)
-                    code_language = line.strip()[3:].strip()
-                    code_content = []
-                else:
-                    # Fin du bloc de code
-                    in_code_block = False
-                    
-                    # Ajouter le bloc de code au document
-                    if code_language:
-                        lang_p = doc.add_paragraph()
-                        lang_run = lang_p.add_run(f"Code ({code_language}):")
-                        lang_run.bold = True
-                    
-                    # Ajouter le contenu du code
-                    code_text = '\n'.join(code_content)
-                    code_p = doc.add_paragraph()
-                    code_run = code_p.add_run(code_text)
-                    
-                    # Appliquer le style au bloc de code
-                    apply_style(code_run, config["styles"]["code_block"])
-                    
-                    # Ajouter un espace après le bloc de code
-                    doc.add_paragraph()
-                i += 1
-                continue
+            if kind == 'text':
+                # Texte normal : le paragraphe et ses runs sont construits
+                # directement avec leurs propriétés précalculées
+                if normal_paragraph_properties is None:
+                    normal_paragraph = Paragraph(OxmlElement('w:p'), None)
+                    apply_para_style(normal_paragraph, styles["normal"])
+                    normal_paragraph_properties = element_xml(normal_paragraph._p.pPr)
+                runs_xml = formatted_runs_xml(op[1], normal_run_properties)
+                doc.add_paragraph_xml(f'<w:p {_W_NSDECL}>{normal_paragraph_properties}{runs_xml}</w:p>')
             
-            if in_code_block:
-                # Ajouter cette ligne au contenu du code
-                code_content.append(line)
-                i += 1
-                continue
+            elif kind == 'blank':
+                doc.add_paragraph()
             
-            # Traitement des titres (h1 à h6)
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if header_match:
-                level = len(header_match.group(1))
-                title_text = header_match.group(2).strip()
+            elif kind == 'list':
+                _, list_type, indent_level, list_runs = op
                 
-                # Ajouter le titre au document
-                heading = doc.add_heading(title_text, level=level)
+                # Propriétés du paragraphe (style, espacement, retrait selon le niveau),
+                # calculées une seule fois par type de liste et niveau
+                list_key = (list_type, indent_level)
+                paragraph_properties = list_paragraph_properties.get(list_key)
+                if paragraph_properties is None:
+                    # Retraits par niveau, résolus au premier élément de liste
+                    if list_indents is None:
+                        list_indent_base = float(styles["list_item"]["left_indent"])
+                        list_indents = tuple(Inches((level + 1) * list_indent_base) for level in range(_LIST_LEVELS))
+                    list_paragraph = Paragraph(OxmlElement('w:p'), None)
+                    list_paragraph._p.style = doc.styles[_LIST_STYLE_NAMES[list_type]].style_id
+                    list_paragraph.paragraph_format.space_after = Pt(0)  # Réduire l'espace après chaque élément
+                    if indent_level < _LIST_LEVELS:
+                        list_paragraph.paragraph_format.left_indent = list_indents[indent_level]
+                    else:
+                        list_paragraph.paragraph_format.left_indent = Inches((indent_level + 1) * list_indent_base)
+                    paragraph_properties = element_xml(list_paragraph._p.pPr)
+                    list_paragraph_properties[list_key] = paragraph_properties
                 
-                # Appliquer un style spécifique
-                style_key = f'h{level}'
-                if style_key in config["styles"]:
-                    apply_heading_style(heading, config["styles"][style_key])
+                # Ajouter le paragraphe avec tous ses runs déjà mis en forme
+                runs_xml = formatted_runs_xml(list_runs, list_run_properties)
+                doc.add_paragraph_xml(f'<w:p {_W_NSDECL}>{paragraph_properties}{runs_xml}</w:p>')
+            
+            elif kind == 'heading':
+                _, level, title_text = op
                 
-                i += 1
-                continue
+                # Ajouter le titre au document avec son style déjà appliqué
+                doc.add_paragraph_xml(heading_xml(title_text, heading_properties[level]))
             
-            # Traitement des éléments de liste
-            list_match = re.match(r'^(\s*)([\*\-\+]|\d+\.)\s+(.+)$', line)
-            if list_match:
-                indentation = len(list_match.group(1))
-                list_marker = list_match.group(2)
-                content = list_match.group(3)
+            elif kind == 'code':
+                _, code_language, code_text = op
                 
-                # Déterminer le type de liste
-                if list_marker in ['*', '-', '+']:
-                    current_list_type = 'ul'
-                else:
-                    current_list_type = 'ol'
+                # Ajouter le bloc de code au document
+                if code_language:
+                    lang_p = doc.add_paragraph()
+                    lang_run = lang_p.add_run(f"Code ({code_language}):")
+                    lang_run.bold = True
                 
-                # Calculer le niveau d'indentation
-                indent_level = indentation // 2
+                code_p = doc.add_paragraph()
+                code_run = code_p.add_run(code_text)
                 
-                # Créer un paragraphe pour l'élément de liste
-                p = doc.add_paragraph()
-                p.style = 'List Bullet' if current_list_type == 'ul' else 'List Number'
-                p.paragraph_format.space_after = Pt(0)  # Réduire l'espace après chaque élément
+                # Appliquer le style au bloc de code
+                apply_style(code_run, styles["code_block"])
                 
-                # Ajuster l'indentation en fonction du niveau
-                p.paragraph_format.left_indent = Inches((indent_level + 1) * float(config["styles"]["list_item"]["left_indent"]))
+                # Ajouter un espace après le bloc de code
+                doc.add_paragraph()
+            
+            elif kind == 'table':
+                _, header_row, rows_data = op
                 
-                # Traiter le contenu avec formatage inline
-                remaining_text = content
-                formatted_runs = []
+                # Créer le tableau Word
+                num_cols = len(header_row)
+                table = doc.add_table(rows=len(rows_data) + 1, cols=num_cols)
+                table.style = 'Table Grid'
                 
-                # Analyser tout le texte pour identifier les portions formatées
-                while remaining_text:
-                    # Texte en gras: **texte** ou __texte__
-                    bold_match = re.search(r'(\*\*|__)(.*?)(\1)', remaining_text)
-                    # Texte en italique: *texte* ou _texte_
-                    italic_match = re.search(r'([*_])((?!\1).*?)(\1)', remaining_text)
-                    # Code inline: `texte`
-                    code_match = re.search(r'`(.*?)`', remaining_text)
-                    # Lien: [texte](url)
-                    link_match = re.search(r'\[(.*?)\]\((.*?)\)', remaining_text)
-                    
-                    # Trouver le premier match
-                    matches = [(bold_match, 'bold'), (italic_match, 'italic'), 
-                            (code_match, 'code'), (link_match, 'link')]
-                    valid_matches = [(m, t) for m, t in matches if m]
-                    
-                    if valid_matches:
-                        # Trier par position de début
-                        valid_matches.sort(key=lambda x: x[0].start())
-                        match, match_type = valid_matches[0]
-                        
-                        # Ajouter le texte avant le match
-                        if match.start() > 0:
-                            formatted_runs.append(('normal', remaining_text[:match.start()]))
-                        
-                        # Ajouter le match avec son style
-                        if match_type == 'bold':
-                            formatted_runs.append(('bold', match.group(2)))
-                        elif match_type == 'italic':
-                            formatted_runs.append(('italic', match.group(2)))
-                        elif match_type == 'code':
-                            formatted_runs.append(('code', match.group(1)))
-                        elif match_type == 'link':
-                            formatted_runs.append(('link', match.group(1)))
-                        
-                        # Continuer avec le reste du texte
-                        remaining_text = remaining_text[match.end():]
-                    else:
-                        # Aucun format spécial trouvé, ajouter tout le texte restant
-                        formatted_runs.append(('normal', remaining_text))
-                        break
+                # Remplir l'en-tête (gras avec couleur de fond) puis les données,
+                # en construisant directement le XML de chaque cellule
+                # Fond et propriétés des runs, construits au premier tableau
+                if table_properties is None:
+                    table_style = styles["table"]
+                    table_header_bg = table_style["header_bg_color"]
+                    table_properties = (
+                        f"{table_header_bg['r']:02x}{table_header_bg['g']:02x}{table_header_bg['b']:02x}",
+                        table_run_properties(table_style["font_name"], bold=True),
+                        table_run_properties(table_style["font_name"], table_style["font_size"])
+                    )
+                table_header_fill, table_header_rpr, table_cell_rpr = table_properties
                 
-                # Ajouter tous les runs au paragraphe avec leur format
-                for format_type, text in formatted_runs:
-                    run = p.add_run(text)
-                    if format_type == 'bold':
-                        run.bold = True
-                    elif format_type == 'italic':
-                        run.italic = True
-                    elif format_type == 'link':
-                        run.underline = True
-                    
-                    # Appliquer le style approprié
-                    if format_type == 'code':
-                        apply_style(run, config["styles"]["code"])
-                    else:
-                        apply_style(run, config["styles"]["list_item"])
+                tr_lst = table._tbl.tr_lst
+                for tc, cell_text in zip(tr_lst[0].tc_lst, header_row):
+                    fill_table_cell(tc, cell_text, table_header_rpr, fill=table_header_fill)
                 
-                i += 1
-                continue
-            
-            # Traitement des tableaux (syntaxe markdown)
-            if line.strip().startswith('|') and line.strip().endswith('|'):
-                # Collecte des lignes de tableau
-                table_lines = []
-                while i < len(lines) and lines[i].strip().startswith('|') and lines[i].strip().endswith('|'):
-                    table_lines.append(lines[i])
-                    i += 1
+                for tr, row_data in zip(tr_lst[1:], rows_data):
+                    # zip ignore les cellules au-delà du nombre de colonnes
+                    for tc, cell_text in zip(tr.tc_lst, row_data):
+                        fill_table_cell(tc, cell_text, table_cell_rpr)
                 
-                # S'assurer qu'il y a au moins un séparateur et une ligne de données
-                if len(table_lines) >= 3:
-                    # Extraction des cellules
-                    header_row = [cell.strip() for cell in table_lines[0].strip('|').split('|')]
-                    rows_data = []
-                    
-                    # Ignorer la ligne de séparation (---|---|...)
-                    for table_line in table_lines[2:]:
-                        rows_data.append([cell.strip() for cell in table_line.strip('|').split('|')])
-                    
-                    # Créer le tableau Word
-                    num_cols = len(header_row)
-                    table = doc.add_table(rows=len(rows_data) + 1, cols=num_cols)
-                    table.style = 'Table Grid'
-                    
-                    # Remplir l'en-tête
-                    for j, cell_text in enumerate(header_row):
-                        cell = table.cell(0, j)
-                        cell.text = cell_text
-                        
-                        # Style d'en-tête
-                        for paragraph in cell.paragraphs:
-                            for run in paragraph.runs:
-                                run.font.bold = True
-                                run.font.name = config["styles"]["table"]["font_name"]
-                        
-                        # Couleur de fond
-                        header_bg = config["styles"]["table"]["header_bg_color"]
-                        shade_cell(cell, header_bg["r"], header_bg["g"], header_bg["b"])
-                    
-                    # Remplir les données
-                    for row_idx, row_data in enumerate(rows_data):
-                        for col_idx, cell_text in enumerate(row_data):
-                            if col_idx < num_cols:  # Éviter les index hors limites
-                                cell = table.cell(row_idx + 1, col_idx)
-                                cell.text = cell_text
-                                
-                                # Style de cellule
-                                for paragraph in cell.paragraphs:
-                                    for run in paragraph.runs:
-                                        run.font.name = config["styles"]["table"]["font_name"]
-                                        run.font.size = Pt(config["styles"]["table"]["font_size"])
-                    
-                    # Espace après le tableau
-                    doc.add_paragraph()
-                continue
-            
-            # Détection d'images markdown ![alt](url)
-            img_match = re.match(r'!\[(.*?)\]\((.*?)\)', line)
-            if img_match:
-                alt_text = img_match.group(1)
-                img_path = img_match.group(2)
-                add_image_to_doc(doc, img_path, base_path, config, alt_text)
-                i += 1
-                continue
-            
-            # Traitement du texte normal
-            # Si ligne vide ou seulement des espaces
-            if not line.strip():
+                # Espace après le tableau
                 doc.add_paragraph()
-                i += 1
-                continue
-            
-            # Texte normal
-            p = doc.add_paragraph()
             
-            # Traitement du texte avec formatage inline amélioré
-            remaining_text = line
-            formatted_runs = []
-            
-            # Analyser tout le texte pour identifier les portions formatées
-            while remaining_text:
-                # Texte en gras: **texte** ou __texte__
-                bold_match = re.search(r'(\*\*|__)(.*?)(\1)', remaining_text)
-                # Texte en italique: *texte* ou _texte_
-                italic_match = re.search(r'([*_])((?!\1).*?)(\1)', remaining_text)
-                # Code inline: `texte`
-                code_match = re.search(r'`(.*?)`', remaining_text)
-                # Lien: [texte](url)
-                link_match = re.search(r'\[(.*?)\]\((.*?)\)', remaining_text)
-                
-                # Trouver le premier match
-                matches = [(bold_match, 'bold'), (italic_match, 'italic'), 
-                        (code_match, 'code'), (link_match, 'link')]
-                valid_matches = [(m, t) for m, t in matches if m]
-                
-                if valid_matches:
-                    # Trier par position de début
-                    valid_matches.sort(key=lambda x: x[0].start())
-                    match, match_type = valid_matches[0]
-                    
-                    # Ajouter le texte avant le match
-                    if match.start() > 0:
-                        formatted_runs.append(('normal', remaining_text[:match.start()]))
-                    
-                    # Ajouter le match avec son style
-                    if match_type == 'bold':
-                        formatted_runs.append(('bold', match.group(2)))
-                    elif match_type == 'italic':
-                        formatted_runs.append(('italic', match.group(2)))
-                    elif match_type == 'code':
-                        formatted_runs.append(('code', match.group(1)))
-                    elif match_type == 'link':
-                        formatted_runs.append(('link', match.group(1)))
-                    
-                    # Continuer avec le reste du texte
-                    remaining_text = remaining_text[match.end():]
-                else:
-                    # Aucun format spécial trouvé, ajouter tout le texte restant
-                    formatted_runs.append(('normal', remaining_text))
-                    break
-            
-            # Ajouter tous les runs au paragraphe avec leur format
-            for format_type, text in formatted_runs:
-                run = p.add_run(text)
-                if format_type == 'bold':
-                    run.bold = True
-                elif format_type == 'italic':
-                    run.italic = True
-                elif format_type == 'link':
-                    run.underline = True
-                
-                # Appliquer le style approprié
-                if format_type == 'code':
-                    apply_style(run, config["styles"]["code"])
-                else:
-                    apply_style(run, config["styles"]["normal"])
-            
-            # Appliquer le style de paragraphe
-            apply_para_style(p, config["styles"]["normal"])
-            
-            i += 1
+            elif kind == 'image':
+                _, alt_text, img_path = op
+                add_image_to_doc(doc, img_path, base_path, config, alt_text, image_cache, styles)
     
     # Enregistrer le document Word
     doc.save(output_file)
@@ -1102,7 +1684,7 @@ def create_default_config(output_file="config.json"):
 
 def main():
     parser = argparse.ArgumentParser(description='Convertir des fichiers Markdown en document Word avec support avancé.')
-    parser.add_argument('input', nargs='+', help='Fichier(s) Markdown à convertir')
+    parser.add_argument('input', nargs='*', help='Fichier(s) Markdown à convertir')
     parser.add_argument('-o', '--output', default='output.docx', help='Fichier Word de sortie')
     parser.add_argument('-c', '--config', help='Fichier de configuration (JSON)')
     parser.add_argument('--create-config', action='store_true', help='Créer un fichier de configuration par défaut')
@@ -1113,6 +1695,10 @@ def main():
         create_default_config()
         return
     
+    # Les fichiers d'entrée ne sont requis que pour la conversion
+    if not args.input:
+        parser.error("au moins un fichier Markdown est requis")
+    
     convert_markdown_to_docx(args.input, args.output, args.config)
 
 if __name__ == "__main__":